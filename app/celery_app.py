@@ -10,7 +10,10 @@ Architecture:
 - Workers: Execute tasks (run via: celery -A app.celery_app worker)
 """
 
+import os
+import redis
 from celery import Celery
+from celery.signals import worker_process_init
 from app.config import settings
 
 # Create Celery application instance
@@ -30,5 +33,79 @@ celery_app.conf.update(
     
     # Import task modules
     # These modules contain @celery_app.task decorated functions
-    imports=["app.tasks", "app.finalize_task"]
+    imports=["app.tasks", "app.finalize_task"],
+
+    # Route heavy conversion work and cheap finalize checks to separate
+    # queues so finalize dispatches can never starve conversion workers.
+    # Intended worker layout (see docker-compose.yml):
+    #   celery -A app.celery_app worker -Q convert --pool=prefork -c <cores/2>
+    #   celery -A app.celery_app worker -Q finalize --pool=threads -c 4
+    # Conversion workers run prefork at roughly half the cores because
+    # each task drives a whole LibreOffice process; finalize tasks block
+    # in psycopg2 and file I/O, so a small thread pool is enough and
+    # keeps DB connection demand bounded.
+    task_routes={
+        "app.tasks.convert_file_task": {"queue": "convert"},
+        "app.tasks.convert_file_batch_task": {"queue": "convert"},
+        "app.tasks.finalize_job_task": {"queue": "finalize"},
+    },
+
+    # Default concurrency for workers started without -c: half the cores,
+    # so LibreOffice instances don't thrash each other. The -c flag on the
+    # command line overrides this per worker set.
+    worker_concurrency=max(1, (os.cpu_count() or 2) // 2),
+
+    # Conversions are long; fetch one task at a time and ack after
+    # completion so a dying worker's batch gets redelivered
+    worker_prefetch_multiplier=1,
+    task_acks_late=True
 )
+
+# Test hook: with CELERY_TASK_ALWAYS_EAGER set, tasks run inline in the
+# dispatching process instead of going through the broker, so the test
+# suite needs neither Redis nor a running worker.
+if os.environ.get("CELERY_TASK_ALWAYS_EAGER"):
+    celery_app.conf.task_always_eager = True
+
+# Shared Redis connection pool for application-level Redis commands
+# (finalize debounce counters, caching). Kombu manages its own broker
+# connections - this pool is only for our direct redis usage, so each
+# operation reuses an established connection instead of paying a TCP
+# handshake + AUTH round-trip.
+#
+# The pool is created lazily (not at import time) so Celery's prefork
+# children don't inherit live sockets from the parent process.
+_redis_pool = None
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Return a Redis client backed by the shared connection pool.
+
+    The client object itself is cheap to create; all connections come
+    from (and return to) the module-level BlockingConnectionPool.
+
+    Returns:
+        redis.Redis: Client bound to the shared pool
+    """
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=32,  # Cap per process; blocks (up to timeout) when exhausted
+            timeout=5
+        )
+    return redis.Redis(connection_pool=_redis_pool)
+
+
+@worker_process_init.connect
+def _reset_redis_pool(**kwargs):
+    """
+    Drop any pool state inherited across the prefork boundary.
+
+    Runs once per worker child so each process lazily builds its own
+    pool with its own sockets instead of sharing file descriptors with
+    the parent.
+    """
+    global _redis_pool
+    _redis_pool = None
@@ -5,13 +5,30 @@ Sets up SQLAlchemy engine, session factory, and base model class.
 Provides a dependency function for FastAPI route handlers to get database sessions.
 """
 
+import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from app.config import settings
 
 # Create database engine
 # This connects to PostgreSQL in Docker, SQLite for local development
-engine = create_engine(settings.DATABASE_URL)
+if settings.DATABASE_URL.startswith("postgresql"):
+    # Explicit pool tuning for PostgreSQL. The defaults (5 + 10 overflow,
+    # no pre-ping, FIFO checkout) saturate quickly once API workers and
+    # Celery prefork children each hold connections, and idle workers end
+    # up with stale sockets after network blips or server restarts.
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=max(8, os.cpu_count() or 1),
+        max_overflow=2 * (os.cpu_count() or 1),
+        pool_pre_ping=True,   # Revalidate before use instead of failing mid-query
+        pool_recycle=1800,    # Retire connections before server-side idle timeouts
+        pool_use_lifo=True,   # Reuse the warmest connection first
+    )
+else:
+    # SQLite (local development / tests) doesn't benefit from the
+    # PostgreSQL pool tuning, so it keeps the defaults
+    engine = create_engine(settings.DATABASE_URL)
 
 # Create session factory
 # Sessions are used to interact with the database (queries, commits, etc.)
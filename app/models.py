@@ -12,8 +12,9 @@ Relationships:
 - Deleting a Job cascades to delete all its JobFiles
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SqEnum
+from sqlalchemy import CHAR, Column, Integer, String, DateTime, ForeignKey, Index, Enum as SqEnum
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -51,6 +52,44 @@ class FileStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+class FileStatusType(TypeDecorator):
+    """
+    Store FileStatus as a single character instead of a database enum.
+
+    The finalize task aggregates job_files.status constantly, and a
+    fixed-width CHAR(1) keeps the (job_id, status) index narrow so those
+    counts stay index-only scans. It also avoids PostgreSQL's custom enum
+    type, whose every new value needs a DDL migration.
+
+    Python code is unaffected: the ORM still reads and writes FileStatus
+    members; only the on-disk representation changes.
+    """
+    impl = CHAR(1)
+    cache_ok = True
+
+    # FileStatus <-> stored character
+    # PROCESSING maps to "R" (running) since "P" is taken by PENDING
+    _to_char = {
+        FileStatus.PENDING: "P",
+        FileStatus.PROCESSING: "R",
+        FileStatus.COMPLETED: "C",
+        FileStatus.FAILED: "F",
+    }
+    _from_char = {char: status for status, char in _to_char.items()}
+
+    def process_bind_param(self, value, dialect):
+        """Convert a FileStatus (or its string value) to its stored character."""
+        if value is None:
+            return None
+        return self._to_char[FileStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        """Convert a stored character back to a FileStatus member."""
+        if value is None:
+            return None
+        return self._from_char[value]
+
+
 class Job(Base):
     """
     Represents a bulk conversion job.
@@ -78,10 +117,25 @@ class JobFile(Base):
     """
     __tablename__ = "job_files"
 
+    # Composite index on (job_id, status): the conversion and finalization
+    # tasks constantly filter/aggregate by this pair, so the status counts
+    # become index-only scans instead of scan-and-filter on job_id alone.
+    # Queries on job_id by itself use the leading column of this index,
+    # so the column needs no separate single-column index
+    __table_args__ = (
+        Index("ix_job_files_job_status", "job_id", "status"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"))  # Foreign key to Job
     filename = Column(String, nullable=False)
-    status = Column(SqEnum(FileStatus), default=FileStatus.PENDING)
+
+    # Name of the converted PDF ("report.docx" -> "report.pdf")
+    # Resolved once at job creation so the conversion and finalize loops
+    # don't re-derive it per file; nullable for rows predating the column
+    output_filename = Column(String, nullable=True)
+
+    status = Column(FileStatusType, default=FileStatus.PENDING)
     
     # Error message is only populated if status is FAILED
     # Contains details about why the conversion failed
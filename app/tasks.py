@@ -1,145 +1,488 @@
 """
-Celery Task: DOCX to PDF Conversion
+Celery Tasks: DOCX to PDF Conversion
 
-This module contains the background task that converts individual DOCX files to PDF.
-Each file is processed independently, allowing parallel processing and per-file error handling.
+This module contains the background tasks that convert DOCX files to PDF.
+Files are processed in small batches, allowing parallel processing across
+workers and per-file error handling within each batch.
 
 Key Design Decisions:
-1. One task per file (not per job) - Allows parallel processing
-2. LibreOffice subprocess - Free, Linux-compatible converter
+1. One task per batch (not per file) - LibreOffice startup (~1-3 seconds)
+   dominates small conversions, so one invocation converts a whole chunk
+2. Persistent LibreOffice listener - Each worker process keeps one headless
+   LibreOffice running (via unoserver) so conversions skip process startup
+   entirely; a fresh subprocess per batch is the fallback
 3. Per-file error handling - One bad file doesn't fail the entire job
 4. Timeout protection - Prevents hanging on corrupted files
 """
 
 import os
+import hashlib
 import logging
+import shutil
 import subprocess
-from app.celery_app import celery_app
+from celery.signals import worker_process_init, worker_process_shutdown
+from app.celery_app import celery_app, get_redis_client
 from app.database import SessionLocal
 from app.models import JobFile, Job, FileStatus, JobStatus
 from app.config import settings
 
+# unoserver provides a client for a long-running headless LibreOffice.
+# It is optional: without it (or if the listener fails to start), workers
+# fall back to spawning one LibreOffice subprocess per batch.
+try:
+    from unoserver.client import UnoClient
+except ImportError:
+    UnoClient = None
+
 logger = logging.getLogger(__name__)
 
+# Number of DOCX files converted by a single LibreOffice invocation.
+# Large enough to amortize LibreOffice's startup cost, small enough that
+# batches still spread across workers for parallelism.
+BATCH_SIZE = 8
 
-@celery_app.task(bind=True, name="app.tasks.convert_file_task")
-def convert_file_task(self, file_id: int):
+# Per-file conversion time budget in seconds.
+# The subprocess timeout scales with the number of files in the batch.
+CONVERSION_TIMEOUT = 60
+
+# Conversion cache: identical DOCX bytes always produce identical PDFs,
+# so converted PDFs are kept (hardlinked) under this directory keyed by
+# content hash, with the Redis key pdf:{hash} pointing at them.
+# Users re-upload the same templates/boilerplate all the time; cache hits
+# skip LibreOffice entirely.
+PDF_CACHE_DIR = "pdf_cache"
+PDF_CACHE_TTL = 7 * 86400  # Seconds to keep a cached PDF referenced
+
+# Per-worker LibreOffice listener state
+# Populated by the worker_process_init signal, torn down on shutdown.
+_uno_server = None  # subprocess.Popen running unoserver
+_uno_client = None  # UnoClient bound to this worker's listener
+
+
+@worker_process_init.connect
+def _start_libreoffice_listener(**kwargs):
+    """
+    Spawn a persistent headless LibreOffice for this worker process.
+
+    Runs once per prefork child. The listener stays up for the worker's
+    lifetime, so conversion tasks connect to the warm instance instead of
+    paying the LibreOffice startup cost per batch.
+
+    Ports are derived from the PID so sibling worker processes on the
+    same host don't collide.
+    """
+    global _uno_server, _uno_client
+
+    if UnoClient is None:
+        logger.info(
+            "unoserver not installed; using one LibreOffice subprocess per batch"
+        )
+        return
+
+    port = 20000 + (os.getpid() % 10000)
+    uno_port = port + 10000
+
+    try:
+        _uno_server = subprocess.Popen(
+            [
+                "unoserver",
+                "--interface", "127.0.0.1",
+                "--port", str(port),          # XML-RPC port the client talks to
+                "--uno-port", str(uno_port),  # Internal UNO socket to LibreOffice
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        _uno_client = UnoClient(server="127.0.0.1", port=str(port))
+        logger.info(f"Started LibreOffice listener on port {port} (pid {_uno_server.pid})")
+    except Exception as e:
+        logger.error(f"Failed to start LibreOffice listener: {str(e)}")
+        _uno_server = None
+        _uno_client = None
+
+
+@worker_process_shutdown.connect
+def _stop_libreoffice_listener(**kwargs):
+    """Terminate this worker's LibreOffice listener on shutdown."""
+    global _uno_server, _uno_client
+
+    if _uno_server is not None:
+        _uno_server.terminate()
+        try:
+            _uno_server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            _uno_server.kill()
+    _uno_server = None
+    _uno_client = None
+
+
+def _pdf_name(file_record):
+    """
+    Filename of a JobFile's converted PDF.
+
+    Normally the value precomputed at job creation; derived on the fly
+    only for rows created before the output_filename column existed.
+    """
+    if file_record.output_filename:
+        return file_record.output_filename
+    return f"{os.path.splitext(file_record.filename)[0]}.pdf"
+
+
+def _content_hash(path):
+    """
+    Hash a file's contents for the conversion cache.
+
+    BLAKE2b is used because it is significantly faster than SHA-256 on
+    CPU while still collision-resistant; 16 bytes of digest is plenty
+    for a cache key.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Optional[str]: Hex digest, or None if the file couldn't be read
+    """
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError as e:
+        logger.warning(f"Could not hash {path}: {str(e)}")
+        return None
+
+
+def _pdf_cache_fetch(content_hash, output_path):
+    """
+    Materialize a cached PDF for this content hash, if one exists.
+
+    On a hit the cached PDF is hardlinked into place (instant, no bytes
+    copied); if the link fails (e.g. cache on another filesystem) the
+    file is copied instead.
+
+    Args:
+        content_hash: Hex digest of the DOCX contents (may be None)
+        output_path: Where the PDF should appear
+
+    Returns:
+        bool: True if the output PDF was produced from the cache
+    """
+    if content_hash is None:
+        return False
+    try:
+        cached_path = get_redis_client().get(f"pdf:{content_hash}")
+    except Exception:
+        return False  # Redis unavailable: treat as a miss
+    if not cached_path:
+        return False
+
+    cached_path = cached_path.decode()
+    if not os.path.exists(cached_path):
+        return False
+
+    if not os.path.exists(output_path):
+        try:
+            os.link(cached_path, output_path)
+        except OSError:
+            try:
+                shutil.copyfile(cached_path, output_path)
+            except OSError:
+                return False
+
+    # Keep actively reused entries alive
+    try:
+        get_redis_client().expire(f"pdf:{content_hash}", PDF_CACHE_TTL)
+    except Exception:
+        pass
+    return True
+
+
+def _pdf_cache_store(content_hash, output_path):
+    """
+    Record a freshly converted PDF in the conversion cache.
+
+    The PDF is hardlinked into the cache directory (so deleting the job
+    directory later doesn't lose it) and the Redis key is refreshed with
+    a TTL.
+
+    Args:
+        content_hash: Hex digest of the DOCX contents (may be None)
+        output_path: The converted PDF inside the job directory
+    """
+    if content_hash is None:
+        return
+    try:
+        cache_dir = os.path.join(settings.FILE_STORAGE_PATH, PDF_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        cached_path = os.path.join(cache_dir, f"{content_hash}.pdf")
+        if not os.path.exists(cached_path):
+            try:
+                os.link(output_path, cached_path)
+            except OSError:
+                shutil.copyfile(output_path, cached_path)
+        get_redis_client().setex(f"pdf:{content_hash}", PDF_CACHE_TTL, cached_path)
+    except Exception as e:
+        # The cache is best-effort; never fail a conversion over it
+        logger.warning(f"Could not cache PDF for hash {content_hash}: {str(e)}")
+
+
+def _convert_batch_listener(convertible, abs_job_dir):
+    """
+    Convert files through the per-worker LibreOffice listener.
+
+    Each file converts individually over the warm UNO connection, which
+    gives per-file error messages for free. Failed files get their
+    error_message set; success is judged later by the output PDF existing.
+
+    Args:
+        convertible: List of (JobFile, absolute input path) tuples
+        abs_job_dir: Absolute output directory for the PDFs
+
+    Returns:
+        bool: True if the listener handled the batch (even with per-file
+              failures), False if it appears dead and the caller should
+              fall back to the subprocess path.
+    """
+    converted = 0
+    for file_record, input_path in convertible:
+        output_path = os.path.join(abs_job_dir, _pdf_name(file_record))
+        try:
+            _uno_client.convert(inpath=input_path, outpath=output_path)
+            converted += 1
+        except Exception as e:
+            logger.error(
+                f"Listener conversion failed for file {file_record.id}: {str(e)}"
+            )
+            file_record.error_message = str(e)
+
+    if converted == 0:
+        # Nothing converted - the listener is likely not up (yet).
+        # Clear the per-file errors so the subprocess fallback gets a
+        # clean slate.
+        for file_record, _ in convertible:
+            file_record.error_message = None
+        return False
+    return True
+
+
+def _convert_batch_subprocess(convertible, abs_job_dir):
+    """
+    Convert a batch of files with a single LibreOffice subprocess.
+
+    Why LibreOffice?
+    - Free and open-source
+    - Works on Linux (docx2pdf requires Microsoft Word)
+    - Reliable and widely used
+    - Supports headless mode (no GUI)
+
+    Args:
+        convertible: List of (JobFile, absolute input path) tuples
+        abs_job_dir: Absolute output directory for the PDFs
+
+    Returns:
+        Optional[str]: Error message covering the batch, or None on success.
     """
-    Convert a single DOCX file to PDF using LibreOffice.
-    
+    try:
+        result = subprocess.run(
+            [
+                'libreoffice',
+                '--headless',              # No GUI
+                '--convert-to', 'pdf',     # Output format
+                '--outdir', abs_job_dir,   # Output directory
+            ] + [path for _, path in convertible],  # All inputs at once
+            capture_output=True,  # Capture stdout/stderr
+            text=True,            # Decode output as text
+            # Time budget scales with batch size
+            timeout=CONVERSION_TIMEOUT * len(convertible)
+        )
+        if result.returncode != 0:
+            return f"LibreOffice conversion failed: {result.stderr}"
+        return None
+
+    except subprocess.TimeoutExpired:
+        # Conversion took too long for the whole batch
+        # This can happen with very large files or corrupted files
+        return (
+            f"Conversion timeout (exceeded "
+            f"{CONVERSION_TIMEOUT * len(convertible)} seconds)"
+        )
+
+    except Exception as e:
+        # Any other conversion error (LibreOffice missing, etc.)
+        return str(e)
+
+
+@celery_app.task(bind=True, name="app.tasks.convert_file_batch_task")
+def convert_file_batch_task(self, file_ids: list):
+    """
+    Convert a batch of DOCX files to PDF.
+
     This task is executed by Celery workers in the background.
-    Each file is processed independently to allow parallel execution.
-    
+    Conversion goes through the worker's persistent LibreOffice listener
+    when available, otherwise a single LibreOffice subprocess handles
+    the whole batch.
+
     Args:
-        file_id: Database ID of the JobFile to convert
-    
+        file_ids: Database IDs of the JobFiles to convert
+                  (all files must belong to the same job)
+
     Flow:
-        1. Fetch file record from database
-        2. Update status to PROCESSING
-        3. Run LibreOffice conversion (subprocess)
-        4. Update status to COMPLETED or FAILED
-        5. Trigger job finalization check
-    
+        1. Fetch file records from database
+        2. Update statuses to PROCESSING
+        3. Convert the batch (persistent listener or one subprocess)
+        4. Mark each file COMPLETED or FAILED based on its output PDF
+        5. Commit once and trigger the job finalization check
+
     Error Handling:
-        - File not found: Logs error and returns
-        - Conversion timeout: Marks file as FAILED
-        - Conversion error: Marks file as FAILED with error message
+        - Files not found: Logs error and returns
+        - Conversion timeout: Marks remaining files as FAILED
+        - Conversion error: Marks affected files as FAILED with error message
         - Individual failures don't crash the worker
     """
     db = SessionLocal()
     try:
-        # Fetch file record from database
-        file_record = db.query(JobFile).filter(JobFile.id == file_id).first()
-        if not file_record:
-            logger.error(f"File with id {file_id} not found in database")
-            return "File not found"
-
-        # Update file status to PROCESSING
-        file_record.status = FileStatus.PROCESSING
-        
-        # Update job status to PROCESSING if it's still PENDING
-        job = db.query(Job).filter(Job.id == file_record.job_id).first()
-        if job and job.status == JobStatus.PENDING:
-            job.status = JobStatus.PROCESSING
-        
-        db.commit()
+        # Fetch all file records for the batch in one query
+        file_records = db.query(JobFile).filter(JobFile.id.in_(file_ids)).all()
+        if not file_records:
+            logger.error(f"No files found in database for ids {file_ids}")
+            return "Files not found"
+        if len(file_records) != len(file_ids):
+            logger.warning(
+                f"Batch expected {len(file_ids)} files but found {len(file_records)}"
+            )
+
+        # All files in a batch belong to the same job (create_job chunks per job)
+        job_id = file_records[0].job_id
+
+        # Update file statuses to PROCESSING (in memory only)
+        # The writes are deferred so the whole batch commits exactly once below
+        for file_record in file_records:
+            file_record.status = FileStatus.PROCESSING
 
         # Construct file paths
         # File structure: /app/storage/{job_id}/{filename}
-        job_dir = os.path.join(settings.FILE_STORAGE_PATH, str(file_record.job_id))
-        input_path = os.path.join(job_dir, file_record.filename)
-        
-        # Output PDF will have same name but .pdf extension
-        base_name = os.path.splitext(file_record.filename)[0]
-        output_filename = f"{base_name}.pdf"
-        output_path = os.path.join(job_dir, output_filename)
-
-        # Verify input file exists
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Input file not found at {input_path}")
+        job_dir = os.path.join(settings.FILE_STORAGE_PATH, str(job_id))
+        abs_job_dir = os.path.abspath(job_dir)
+
+        # Separate convertible files from ones whose input is missing
+        convertible = []
+        for file_record in file_records:
+            input_path = os.path.join(job_dir, file_record.filename)
+            if os.path.exists(input_path):
+                convertible.append((file_record, os.path.abspath(input_path)))
+            else:
+                file_record.status = FileStatus.FAILED
+                file_record.error_message = f"Input file not found at {input_path}"
+                logger.error(f"Input file not found for file {file_record.id}: {input_path}")
+
+        if convertible:
+            # Check the conversion cache first: files whose exact bytes were
+            # converted before get their PDF hardlinked into place and skip
+            # LibreOffice entirely
+            to_convert = []
+            content_hashes = {}
+            for file_record, input_path in convertible:
+                output_path = os.path.join(abs_job_dir, _pdf_name(file_record))
+                content_hashes[file_record.id] = _content_hash(input_path)
+
+                if _pdf_cache_fetch(content_hashes[file_record.id], output_path):
+                    logger.info(
+                        f"Conversion cache hit for file {file_record.id}: {file_record.filename}"
+                    )
+                else:
+                    to_convert.append((file_record, input_path))
 
+            # Prefer the warm per-worker listener; fall back to spawning
+            # one LibreOffice subprocess for the whole batch
+            batch_error = None
+            if to_convert:
+                handled = False
+                if _uno_client is not None:
+                    handled = _convert_batch_listener(to_convert, abs_job_dir)
+                if not handled:
+                    batch_error = _convert_batch_subprocess(to_convert, abs_job_dir)
+            freshly_converted = {file_record.id for file_record, _ in to_convert}
+
+            # Judge per-file success by whether the output PDF exists.
+            # LibreOffice converts what it can, so even a non-zero exit can
+            # leave some files successfully converted.
+            for file_record, _ in convertible:
+                output_path = os.path.join(abs_job_dir, _pdf_name(file_record))
+
+                if os.path.exists(output_path):
+                    file_record.status = FileStatus.COMPLETED
+                    file_record.error_message = None
+                    # Only freshly converted PDFs enter the cache;
+                    # cache hits just had their TTL refreshed on fetch
+                    if file_record.id in freshly_converted:
+                        _pdf_cache_store(
+                            content_hashes[file_record.id],
+                            output_path
+                        )
+                    logger.info(
+                        f"Successfully converted file {file_record.id}: {file_record.filename}"
+                    )
+                else:
+                    file_record.status = FileStatus.FAILED
+                    file_record.error_message = (
+                        file_record.error_message
+                        or batch_error
+                        or "Conversion failed: Output PDF not created"
+                    )
+                    logger.error(
+                        f"Conversion failed for file {file_record.id}: "
+                        f"{file_record.error_message}"
+                    )
+
+        # Update job status to PROCESSING if it's still PENDING.
+        # Conditional UPDATE: a no-op after the first batch of the job,
+        # so parallel workers don't fight over the row. Issued here, just
+        # before the commit, so the jobs row lock it takes is held for
+        # microseconds - emitting it before the conversion would hold the
+        # lock (and an open transaction) for the whole LibreOffice run
+        # and serialize every other batch of the same job against it.
+        db.query(Job).filter(
+            Job.id == job_id,
+            Job.status == JobStatus.PENDING
+        ).update({Job.status: JobStatus.PROCESSING}, synchronize_session=False)
+
+        # One commit covers the PROCESSING bump and all terminal statuses
+        db.commit()
+
+        # Trigger job finalization check (debounced via Redis counter)
+        # create_job initializes job:{id}:remaining to the file count; each
+        # batch decrements it by its size and only the task that reaches
+        # zero dispatches finalize. If the counter is missing or Redis is
+        # down, we dispatch anyway - finalize_job_task is idempotent and
+        # exits early while files are still pending.
+        from app.finalize_task import finalize_job_task
         try:
-            # Convert DOCX to PDF using LibreOffice
-            # Why LibreOffice?
-            # - Free and open-source
-            # - Works on Linux (docx2pdf requires Microsoft Word)
-            # - Reliable and widely used
-            # - Supports headless mode (no GUI)
-            
-            abs_input_path = os.path.abspath(input_path)
-            abs_job_dir = os.path.abspath(job_dir)
-            
-            # Run LibreOffice in headless mode
-            result = subprocess.run(
-                [
-                    'libreoffice',
-                    '--headless',              # No GUI
-                    '--convert-to', 'pdf',     # Output format
-                    '--outdir', abs_job_dir,   # Output directory
-                    abs_input_path             # Input file
-                ],
-                capture_output=True,  # Capture stdout/stderr
-                text=True,            # Decode output as text
-                timeout=60            # 60 second timeout per file
+            remaining = get_redis_client().decrby(
+                f"job:{job_id}:remaining", len(file_ids)
             )
-            
-            # Check if conversion succeeded
-            if result.returncode != 0:
-                raise Exception(f"LibreOffice conversion failed: {result.stderr}")
-            
-            # Verify output PDF was created
-            if not os.path.exists(output_path):
-                 raise Exception("Conversion failed: Output PDF not created")
-
-            # Mark file as successfully converted
-            file_record.status = FileStatus.COMPLETED
-            db.commit()
-            logger.info(f"Successfully converted file {file_id}: {file_record.filename}")
-            
-        except subprocess.TimeoutExpired:
-            # Conversion took too long (>60 seconds)
-            # This can happen with very large files or corrupted files
-            logger.error(f"Conversion timeout for file {file_id}")
-            file_record.status = FileStatus.FAILED
-            file_record.error_message = "Conversion timeout (exceeded 60 seconds)"
-            db.commit()
-            
-        except Exception as e:
-            # Any other conversion error (corrupted file, invalid format, etc.)
-            logger.error(f"Conversion error for file {file_id}: {str(e)}")
-            file_record.status = FileStatus.FAILED
-            file_record.error_message = str(e)
-            db.commit()
-            
-        # Trigger job finalization check
-        # This checks if all files in the job are done and creates the final ZIP
-        # It's safe to call this multiple times - it only runs when all files are done
-        from app.finalize_task import finalize_job_task
-        finalize_job_task.delay(file_record.job_id)
+        except Exception:
+            remaining = 0  # Redis unavailable: fall back to per-batch dispatch
+        if remaining <= 0:
+            finalize_job_task.delay(job_id)
 
     except Exception as e:
         # Catch-all for unexpected errors
-        logger.error(f"Unexpected error in convert_file_task for file {file_id}: {str(e)}")
+        logger.error(f"Unexpected error in convert_file_batch_task for files {file_ids}: {str(e)}")
     finally:
         # Always close the database session
         db.close()
+
+
+@celery_app.task(bind=True, name="app.tasks.convert_file_task")
+def convert_file_task(self, file_id: int):
+    """
+    Convert a single DOCX file to PDF.
+
+    Thin wrapper around convert_file_batch_task for callers that operate
+    on one file at a time (e.g. re-queuing an individual failed file).
+
+    Args:
+        file_id: Database ID of the JobFile to convert
+    """
+    return convert_file_batch_task([file_id])
@@ -0,0 +1,206 @@
+"""
+Parallel Writer for Uncompressed (ZIP_STORED) Archives
+
+The standard zipfile module writes members strictly one after another in
+a single thread. For the finalize step - many already-compressed PDFs
+copied into one stored archive - that serial copy is the bottleneck.
+
+Because stored members have a known size up front (no compression), every
+member's byte range in the output file can be computed before any data is
+written. Each member is then copied by a thread pool worker directly into
+its reserved slot with os.pwrite, and the central directory is appended
+last. Python threads scale here because the read/pwrite calls and the
+zlib.crc32 updates all release the GIL.
+
+A plain os.sendfile copy is not possible: the ZIP format requires a CRC32
+of every member, so the data has to pass through userspace once anyway.
+The CRC is folded into the same read/write loop, keeping it single-pass.
+
+Archives that exceed the classic 32-bit ZIP limits (or any copy failure)
+fall back to a serial zipfile-based writer with Zip64 enabled.
+"""
+
+import os
+import shutil
+import struct
+import time
+import logging
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Classic (non-Zip64) format limit for sizes, offsets, and entry counts
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+# Copy buffer size for member data
+_COPY_CHUNK = 1 << 20
+
+# Local file header: sig, version needed, flags, method, time, date,
+# crc, compressed size, uncompressed size, name length, extra length
+_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+
+# Central directory entry: sig, version made by, version needed, flags,
+# method, time, date, crc, csize, usize, name len, extra len, comment len,
+# disk number, internal attrs, external attrs, local header offset
+_CENTRAL_ENTRY = struct.Struct("<4s6H3I5H2I")
+
+# End of central directory: sig, disk, cd disk, entries (disk), entries
+# (total), cd size, cd offset, comment length
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2IH")
+
+# Worker threads per archive; bounded by disk throughput well before CPU
+DEFAULT_WORKERS = 4
+
+
+def _dos_time_date():
+    """Return the current local time as DOS-format (time, date) words."""
+    now = time.localtime()
+    dos_time = (now.tm_hour << 11) | (now.tm_min << 5) | (now.tm_sec // 2)
+    dos_date = ((now.tm_year - 1980) << 9) | (now.tm_mon << 5) | now.tm_mday
+    return dos_time, dos_date
+
+
+def _copy_member(out_fd, name_bytes, flags, source_path, size,
+                 header_offset, dos_time, dos_date):
+    """
+    Write one stored member (local header + data) at its reserved offset.
+
+    The data is copied first while the CRC accumulates, then the complete
+    header is written in one pwrite - no patching pass needed.
+
+    Returns:
+        int: CRC32 of the member data
+
+    Raises:
+        OSError: If the source file's size changed since it was planned
+    """
+    data_offset = header_offset + _LOCAL_HEADER.size + len(name_bytes)
+    crc = 0
+    written = 0
+    with open(source_path, 'rb') as src:
+        while True:
+            chunk = src.read(_COPY_CHUNK)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            os.pwrite(out_fd, chunk, data_offset + written)
+            written += len(chunk)
+
+    if written != size:
+        raise OSError(
+            f"{source_path} changed size during archiving ({written} != {size})"
+        )
+
+    header = _LOCAL_HEADER.pack(
+        b"PK\x03\x04", 20, flags, zipfile.ZIP_STORED,
+        dos_time, dos_date, crc, size, size, len(name_bytes), 0
+    ) + name_bytes
+    os.pwrite(out_fd, header, header_offset)
+    return crc
+
+
+def _write_parallel(members, output_path, max_workers):
+    """
+    Write all members concurrently into their precomputed byte ranges.
+
+    Args:
+        members: List of (arcname, source_path, size) tuples
+        output_path: Destination archive path
+        max_workers: Thread pool size
+
+    Raises:
+        ValueError: If the archive would exceed classic 32-bit ZIP limits
+        OSError: If any member copy fails
+    """
+    dos_time, dos_date = _dos_time_date()
+
+    # Plan every member's header offset up front - possible only because
+    # stored members occupy exactly header + file size bytes
+    plan = []
+    offset = 0
+    for arcname, source_path, size in members:
+        name_bytes = arcname.encode('utf-8')
+        # Bit 11 marks the filename as UTF-8 encoded
+        flags = 0 if arcname.isascii() else 0x800
+        plan.append((name_bytes, flags, source_path, size, offset))
+        offset += _LOCAL_HEADER.size + len(name_bytes) + size
+
+    central_dir_offset = offset
+    # Reject anything past the classic limits up front - sizes/offsets
+    # (32-bit fields) and entry count (16-bit EOCD field) - so oversized
+    # archives go straight to the Zip64-capable serial writer instead of
+    # failing in struct.pack after all the data has been copied
+    if (
+        central_dir_offset > _ZIP32_LIMIT
+        or len(members) > 0xFFFF
+        or any(size > _ZIP32_LIMIT for _, _, size in members)
+    ):
+        raise ValueError("Archive exceeds classic ZIP limits; Zip64 required")
+
+    with open(output_path, 'wb') as out:
+        out_fd = out.fileno()
+
+        # Copy members in parallel; each worker owns a disjoint byte range
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            crcs = list(pool.map(
+                lambda entry: _copy_member(out_fd, entry[0], entry[1], entry[2],
+                                           entry[3], entry[4], dos_time, dos_date),
+                plan
+            ))
+
+        # Central directory goes last, after all member data
+        central_dir = b"".join(
+            _CENTRAL_ENTRY.pack(
+                b"PK\x01\x02", 20, 20, flags, zipfile.ZIP_STORED,
+                dos_time, dos_date, crc, size, size,
+                len(name_bytes), 0, 0, 0, 0,
+                0o644 << 16,  # Regular file, rw-r--r--
+                header_offset
+            ) + name_bytes
+            for (name_bytes, flags, _, size, header_offset), crc in zip(plan, crcs)
+        )
+        end_record = _END_OF_CENTRAL_DIR.pack(
+            b"PK\x05\x06", 0, 0, len(plan), len(plan),
+            len(central_dir), central_dir_offset, 0
+        )
+        os.pwrite(out_fd, central_dir + end_record, central_dir_offset)
+
+
+def _write_serial(members, output_path):
+    """
+    Fallback: write the archive serially through the zipfile module.
+
+    Used when the parallel path can't (Zip64 territory) or a member copy
+    failed. Members are still stored uncompressed and streamed with a
+    large buffer.
+    """
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
+        for arcname, source_path, _ in members:
+            with open(source_path, 'rb') as src, \
+                    zipf.open(arcname, 'w', force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, length=_COPY_CHUNK)
+
+
+def write_stored_zip(members, output_path, max_workers=DEFAULT_WORKERS):
+    """
+    Create an uncompressed ZIP archive from existing files on disk.
+
+    Members are written concurrently when the archive fits the classic
+    ZIP format; anything else (Zip64-sized inputs, copy errors) falls
+    back to a serial zipfile writer so the archive always gets built.
+
+    Args:
+        members: List of (arcname, source_path, size) tuples
+        output_path: Destination archive path
+        max_workers: Thread pool size for the parallel path
+    """
+    try:
+        _write_parallel(members, output_path, max_workers)
+    except Exception as e:
+        logger.warning(
+            f"Parallel ZIP write failed for {output_path} ({str(e)}); "
+            f"falling back to serial writer"
+        )
+        _write_serial(members, output_path)
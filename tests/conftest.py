@@ -0,0 +1,150 @@
+"""
+Shared Pytest Fixtures
+
+Session-scoped fixtures for the API test suite. The ASGI client (and the
+transport behind it) is built once per session instead of once per test,
+so the ~25 API tests stop paying app wiring and client setup each time.
+All tests run on a single session-scoped event loop (see pytest.ini) so
+the shared client can be awaited from any of them.
+"""
+
+import asyncio
+import functools
+import io
+import os
+import zipfile
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from docx import Document
+
+# Give each pytest-xdist worker its own SQLite file so parallel tests
+# don't contend on a single database lock. This must happen before the
+# app (and therefore its settings) is imported.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker and "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///./test_{_xdist_worker}.db"
+
+# Run Celery tasks inline in the test process instead of through a
+# broker: no Redis, no worker, and no polling for a separate process's
+# queue loop to pick the task up. Must be set before the app (and with
+# it app.celery_app) is imported.
+os.environ.setdefault("CELERY_TASK_ALWAYS_EAGER", "1")
+
+from main import app
+
+BASE_URL = "http://testserver"
+
+
+@pytest.fixture(scope="session")
+async def async_client():
+    """One ASGI-backed HTTP client shared by the whole test session.
+
+    ASGITransport calls the app in-process - no sockets, no live server,
+    and therefore no connection pool to size: every request is a direct
+    awaited call into the app, so httpx.Limits would be a no-op here.
+    The explicit timeout raises httpx's 5-second default, which is too
+    tight for submission requests that extract multi-file archives, while
+    still bounding how long a hung endpoint can stall the suite.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url=BASE_URL,
+        timeout=30.0,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def create_docx_file():
+    """Factory fixture to create DOCX files with custom content.
+
+    Memoized: building a python-docx Document costs several ms of XML
+    serialization, and many tests ask for the same (filename, content)
+    pair. Returning bytes keeps the cached value immutable, so tests
+    cannot corrupt each other's documents through the shared cache.
+    """
+    @functools.lru_cache(maxsize=256)
+    def _create_docx(filename: str, content: str = "Test Document") -> bytes:
+        doc = Document()
+        doc.add_heading(content, 0)
+        doc.add_paragraph(f"This is a test document: {filename}")
+        doc.add_paragraph("Lorem ipsum dolor sit amet, consectetur adipiscing elit.")
+
+        # Save to bytes
+        file_stream = io.BytesIO()
+        doc.save(file_stream)
+        file_stream.seek(0)
+        return file_stream.read()
+
+    return _create_docx
+
+
+@pytest.fixture(scope="session")
+def create_zip_file(create_docx_file):
+    """Factory fixture to create ZIP files containing DOCX files.
+
+    Archives are memoized by filename tuple: the tests mostly request the
+    same few name sets, so each distinct archive (and its generated DOCX
+    members) is built exactly once per session. Members are stored rather
+    than deflated - compressing the dummy payloads is pure CPU overhead.
+    """
+    @functools.lru_cache(maxsize=128)
+    def _build_zip(names: tuple) -> bytes:
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+            for filename in names:
+                docx_content = create_docx_file(filename, f"Content for {filename}")
+                zip_file.writestr(filename, docx_content)
+
+        zip_buffer.seek(0)
+        return zip_buffer.read()
+
+    def _create_zip(docx_files: list[str]) -> bytes:
+        return _build_zip(tuple(docx_files))
+
+    return _create_zip
+
+
+@pytest.fixture(autouse=True)
+def no_poll_delay(monkeypatch):
+    """Turn the poll-loop backoff sleeps into bare event-loop yields.
+
+    With Celery running eagerly there is no separate worker to wait for,
+    so any delay in wait_for_job is pure idle wall clock. Only the test
+    module's _sleep alias is patched - asyncio.sleep itself, which the
+    app may rely on, stays real.
+    """
+    monkeypatch.setattr("tests.test_api._sleep", lambda delay: asyncio.sleep(0))
+
+
+@pytest.fixture(scope="session")
+def encode_upload():
+    """Pre-encode multipart upload bodies so each archive is framed once.
+
+    Passing `files=...` to httpx re-runs the multipart encoder (boundary
+    generation, header serialization, payload copy) on every request.
+    Tests repeatedly upload the same few archives, so render the body
+    once per (name, payload) pair and replay the raw bytes with
+    `content=` and an explicit Content-Type header. The body is built by
+    hand (RFC 7578 is a few framing lines) rather than through httpx
+    internals, so the memoization can't be broken by an httpx upgrade.
+    """
+    @functools.lru_cache(maxsize=128)
+    def _encode(upload_name: str, payload: bytes,
+                content_type: str = "application/zip") -> tuple[bytes, str]:
+        boundary = os.urandom(16).hex()
+        body = (
+            (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; '
+                f'filename="{upload_name}"\r\n'
+                f"Content-Type: {content_type}\r\n"
+                f"\r\n"
+            ).encode("utf-8")
+            + payload
+            + f"\r\n--{boundary}--\r\n".encode("utf-8")
+        )
+        return body, f"multipart/form-data; boundary={boundary}"
+
+    return _encode
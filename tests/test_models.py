@@ -7,26 +7,67 @@ without requiring the full API stack.
 
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 from app.database import Base
 from app.models import Job, JobFile, JobStatus, FileStatus
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a test database for each test."""
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="session")
+def test_engine():
+    """Session-scoped engine so the schema DDL runs exactly once.
+
+    Uses a shared-cache in-memory database so every connection from this
+    engine sees the same tables. One connection is held open for the
+    whole session - SQLite drops a shared-cache in-memory database when
+    its last connection closes.
+    """
+    engine = create_engine("sqlite:///file::memory:?cache=shared&uri=true")
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Durability doesn't matter for a throwaway test database, so
+        # trade it for speed: no fsync, in-memory journal and temp files
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    hold = engine.connect()
     Base.metadata.create_all(bind=engine)
-    
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = TestSessionLocal()
-    
+
+    yield engine
+
+    hold.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """Per-test session isolated by an outer transaction plus SAVEPOINT.
+
+    Each test runs inside a nested SAVEPOINT on a never-committed outer
+    transaction; rolling the outer transaction back on teardown undoes
+    everything the test wrote without any per-test CREATE/DROP TABLE.
+    The event hook restarts the SAVEPOINT whenever a test commits, so
+    in-test commits behave normally but still roll back at teardown.
+    """
+    connection = test_engine.connect()
+    trans = connection.begin()
+    db = Session(bind=connection, autoflush=False)
+    db.begin_nested()
+
+    @event.listens_for(db, "after_transaction_end")
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            session.begin_nested()
+
     yield db
-    
+
     db.close()
-    Base.metadata.drop_all(bind=engine)
+    trans.rollback()
+    connection.close()
 
 
 class TestJobModel:
@@ -36,9 +77,10 @@ class TestJobModel:
         """Test creating a new job."""
         job = Job(status=JobStatus.PENDING)
         test_db.add(job)
-        test_db.commit()
-        test_db.refresh(job)
-        
+        # flush() populates id and created_at via RETURNING; no commit
+        # plus refresh SELECT round-trip needed
+        test_db.flush()
+
         assert job.id is not None
         assert job.status == JobStatus.PENDING
         assert isinstance(job.created_at, datetime)
@@ -53,14 +95,14 @@ class TestJobModel:
             JobStatus.PARTIAL_SUCCESS
         ]
         
-        for status in statuses:
-            job = Job(status=status)
-            test_db.add(job)
-            test_db.commit()
-            test_db.refresh(job)
+        # One INSERT batch and one commit instead of a commit/refresh/
+        # delete/commit cycle per status value
+        jobs = [Job(status=status) for status in statuses]
+        test_db.add_all(jobs)
+        test_db.commit()
+
+        for job, status in zip(jobs, statuses):
             assert job.status == status
-            test_db.delete(job)
-            test_db.commit()
 
 
 class TestJobFileModel:
@@ -70,18 +112,16 @@ class TestJobFileModel:
         """Test creating a job file."""
         job = Job(status=JobStatus.PENDING)
         test_db.add(job)
-        test_db.commit()
-        test_db.refresh(job)
-        
+        test_db.flush()
+
         job_file = JobFile(
             job_id=job.id,
             filename="test.docx",
             status=FileStatus.PENDING
         )
         test_db.add(job_file)
-        test_db.commit()
-        test_db.refresh(job_file)
-        
+        test_db.flush()
+
         assert job_file.id is not None
         assert job_file.job_id == job.id
         assert job_file.filename == "test.docx"
@@ -91,9 +131,8 @@ class TestJobFileModel:
         """Test relationship between Job and JobFile."""
         job = Job(status=JobStatus.PENDING)
         test_db.add(job)
-        test_db.commit()
-        test_db.refresh(job)
-        
+        test_db.flush()
+
         # Add multiple files
         for i in range(3):
             job_file = JobFile(
@@ -102,9 +141,9 @@ class TestJobFileModel:
                 status=FileStatus.PENDING
             )
             test_db.add(job_file)
-        
-        test_db.commit()
-        
+
+        test_db.flush()
+
         # Verify relationship
         assert len(job.files) == 3
         assert all(f.job_id == job.id for f in job.files)
@@ -113,8 +152,8 @@ class TestJobFileModel:
         """Test storing error messages in job files."""
         job = Job(status=JobStatus.PENDING)
         test_db.add(job)
-        test_db.commit()
-        
+        test_db.flush()
+
         job_file = JobFile(
             job_id=job.id,
             filename="error.docx",
@@ -122,9 +161,8 @@ class TestJobFileModel:
             error_message="Conversion failed: Invalid file format"
         )
         test_db.add(job_file)
-        test_db.commit()
-        test_db.refresh(job_file)
-        
+        test_db.flush()
+
         assert job_file.error_message == "Conversion failed: Invalid file format"
     
     def test_cascade_delete(self, test_db):
@@ -0,0 +1,98 @@
+"""
+Unit Tests for the Parallel Stored-ZIP Writer
+
+Verifies that archives produced by write_stored_zip are valid ZIP files
+that round-trip through the standard zipfile module, including the
+serial fallback path.
+"""
+
+import io
+import zipfile
+
+import pytest
+from app.zip_writer import write_stored_zip, _write_serial
+
+
+@pytest.fixture
+def source_files(tmp_path):
+    """Create a handful of files with distinct contents to archive."""
+    contents = {
+        "report.pdf": b"%PDF-1.4 report " * 1000,
+        "summary.pdf": b"%PDF-1.4 summary " * 10,
+        "empty.pdf": b"",
+    }
+    members = []
+    for name, data in contents.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        members.append((name, str(path), len(data)))
+    return members, contents
+
+
+class TestWriteStoredZip:
+    """Test cases for write_stored_zip."""
+
+    def test_round_trip(self, tmp_path, source_files):
+        """Archive members must read back byte-identical and uncompressed."""
+        members, contents = source_files
+        output = tmp_path / "out.zip"
+
+        write_stored_zip(members, str(output))
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.testzip() is None  # All CRCs valid
+            assert sorted(zipf.namelist()) == sorted(contents)
+            for name, data in contents.items():
+                assert zipf.read(name) == data
+                assert zipf.getinfo(name).compress_type == zipfile.ZIP_STORED
+
+    def test_empty_member_list(self, tmp_path):
+        """An archive with zero members is still a valid ZIP."""
+        output = tmp_path / "empty.zip"
+
+        write_stored_zip([], str(output))
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.namelist() == []
+
+    def test_non_ascii_filename(self, tmp_path):
+        """Non-ASCII member names survive the UTF-8 flag handling."""
+        path = tmp_path / "input.pdf"
+        path.write_bytes(b"data")
+        output = tmp_path / "out.zip"
+
+        write_stored_zip([("béricht.pdf", str(path), 4)], str(output))
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.namelist() == ["béricht.pdf"]
+            assert zipf.read("béricht.pdf") == b"data"
+
+    def test_fallback_on_stale_size(self, tmp_path, source_files):
+        """A wrong planned size must trigger the serial fallback, not a bad archive."""
+        members, contents = source_files
+        # Lie about one member's size so the parallel path fails
+        name, path, size = members[0]
+        members[0] = (name, path, size + 1)
+        output = tmp_path / "out.zip"
+
+        write_stored_zip(members, str(output))
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.testzip() is None
+            assert sorted(zipf.namelist()) == sorted(contents)
+
+    def test_serial_writer_round_trip(self, tmp_path, source_files):
+        """The fallback writer produces an equivalent stored archive."""
+        members, contents = source_files
+        output = tmp_path / "serial.zip"
+
+        _write_serial(members, str(output))
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.testzip() is None
+            for name, data in contents.items():
+                assert zipf.read(name) == data
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])